@@ -5,28 +5,310 @@
 
 import aiohttp
 import asyncio
-import json
+import multiprocessing
+import orjson
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from bs4 import BeautifulSoup
+from types import MappingProxyType
+import lxml.etree
+import lxml.html
 import re
+import threading
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# 保持长连接并请求压缩传输，aiohttp 会自动解压
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+REQUEST_HEADERS = {
+    'Connection': 'keep-alive',
+    'Accept-Encoding': 'gzip, deflate',
+    'User-Agent': USER_AGENT
+}
+
+# 区分建连、读取与整体超时，尽快放弃无法连接或无响应的请求
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=3, sock_read=7)
+
+# 预编译正则，避免每个省份重复查找正则缓存
+_PRICE_NUM = re.compile(r'([\d.]+)')
+_TIME_RE = re.compile(r'下次油价(\d+月\d+日\d+时调整)')
+_TREND_RE = re.compile(r'目前预计(上调|下调)油价.*?\(([\d.]+)元/升')
+# 单次扫描匹配所有油品，分组1为油品标识，分组2为价格
+_OIL_RE = re.compile(r'<dt>[^<]*?(92#|95#|98#|0#|柴油)[^<]*</dt>\s*<dd[^>]*>\s*([\d.]+)')
+_OIL_KEYS = {'92#': '92', '95#': '95', '98#': '98', '0#': '0', '柴油': '0'}
+_OIL_PRICE_KEYS = frozenset(_OIL_KEYS.values())
+# 定位油价区块与调价信息区块，快速路径只在对应片段内匹配
+_YOUJIA_RE = re.compile(r'id=["\']?youjia["\'\s>]')
+_YOUJIA_CONT_RE = re.compile(r'id=["\']?youjiaCont["\'\s>]')
+_TAG_RE = re.compile(r'<[^>]*>')
+
+# 每个线程复用一个 lxml 解析器，避免重复分配
+_lxml_local = threading.local()
+
+# 条件请求缓存文件：{"version": 版本, "entries": {URL: [ETag, Last-Modified, 上次解析结果]}}
+HTTP_CACHE_FILE = '.http_cache.json'
+# 解析逻辑或结果格式变化时递增，使旧缓存失效
+HTTP_CACHE_VERSION = 2
+
+# 省份配置在导入时加载一次，以只读映射共享
+with open('provinces.json', 'rb') as f:
+    PROVINCES = MappingProxyType(orjson.loads(f.read())['provinces'])
+
+# 进程内共享的TCP连接器，按并发数区分，多次抓取复用连接池与DNS缓存
+_shared_connectors = {}
+_connector_lock = None
+
+
+async def get_shared_connector(max_concurrent):
+    """获取（必要时创建）指定并发数的共享TCP连接器，由 close_shared_connector 关闭"""
+    global _connector_lock
+    if _connector_lock is None:
+        # 延迟创建锁，确保绑定到当前运行的事件循环
+        _connector_lock = asyncio.Lock()
+    async with _connector_lock:
+        connector = _shared_connectors.get(max_concurrent)
+        if connector is None or connector.closed:
+            # 所有请求指向同一站点，单站点上限需与总并发一致
+            connector = aiohttp.TCPConnector(
+                limit=max_concurrent,
+                limit_per_host=max_concurrent,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                keepalive_timeout=75
+            )
+            _shared_connectors[max_concurrent] = connector
+        return connector
+
+
+async def close_shared_connector():
+    """关闭所有共享的TCP连接器"""
+    global _connector_lock
+    for connector in list(_shared_connectors.values()):
+        await connector.close()
+    _shared_connectors.clear()
+    _connector_lock = None
+
+
+def _slice_sections(html):
+    """截取 #youjia 与 #youjiaCont 开始的HTML片段，未找到时对应片段为None"""
+    youjia = _YOUJIA_RE.search(html)
+    youjia_cont = _YOUJIA_CONT_RE.search(html)
+    price_section = None
+    if youjia:
+        # 油价片段截止到调价信息区块，避免匹配页面其他位置的 <dt>
+        end = youjia_cont.start() if youjia_cont and youjia_cont.start() > youjia.start() else len(html)
+        price_section = html[youjia.start():end]
+    adjustment_section = html[youjia_cont.start():] if youjia_cont else None
+    return price_section, adjustment_section
+
+
+def _extract_adjustment_fast(section):
+    """逐个 div 去除标签后解析调价信息，无法确定时返回None"""
+    if '下次油价' not in section:
+        # 没有调价通知，无需再做DOM解析
+        return _stable_adjustment()
+    for chunk in section.split('</div>'):
+        adjustment_info = _parse_adjustment_text(_TAG_RE.sub('', chunk))
+        if adjustment_info:
+            return adjustment_info
+    return None
+
+
+def _extract_prices_fast(html):
+    """使用预编译正则单次扫描油价片段提取油价"""
+    entries = {}
+    for match in _OIL_RE.finditer(html):
+        # 与DOM解析一致，同一油品以最后一次出现为准，异常价格记为0
+        entries[_OIL_KEYS[match.group(1)]] = _parse_price(match.group(2))
+    return entries
+
+
+def _extract_prices_dom(pairs):
+    """从DOM中读取的 (油品名称, 价格文本) 序列解析油价数据"""
+    entries = {}
+    for oil_type_text, price_value in pairs:
+        if '92#' in oil_type_text:
+            entries['92'] = _parse_price(price_value)
+        elif '95#' in oil_type_text:
+            entries['95'] = _parse_price(price_value)
+        elif '98#' in oil_type_text:
+            entries['98'] = _parse_price(price_value)
+        elif '0#' in oil_type_text or '柴油' in oil_type_text:
+            entries['0'] = _parse_price(price_value)
+    return entries
+
+
+def _parse_price(price_text):
+    """解析价格文本为浮点数"""
+    try:
+        numeric_match = _PRICE_NUM.search(price_text)
+        return float(numeric_match.group(1)) if numeric_match else 0
+    except:
+        return 0
+
+
+def _parse_adjustment_text(text):
+    """从文本中解析调价时间与趋势，未找到时返回None"""
+    time_match = _TIME_RE.search(text)
+    if not time_match:
+        return None
+
+    trend_match = _TREND_RE.search(text)
+    if not trend_match:
+        return None
+
+    direction = "up" if trend_match.group(1) == "上调" else "down"
+    amount = float(trend_match.group(2))
+    trend_desc = "上调" if direction == "up" else "下调"
+
+    return {
+        "next_adjustment": time_match.group(0),
+        "trend": {
+            "direction": direction,
+            "amount": amount,
+            "description": f"预计{trend_desc}{amount}元/升"
+        }
+    }
+
+
+def _stable_adjustment():
+    """价格稳定时的默认调整信息"""
+    return {
+        "next_adjustment": None,
+        "trend": {
+            "direction": "stable", 
+            "amount": 0,
+            "description": "价格稳定"
+        }
+    }
+
+
+def _parse_adjustment_info(div_texts):
+    """从调价信息区块的文本序列中解析油价调整信息"""
+    try:
+        for div_text in div_texts:
+            adjustment_info = _parse_adjustment_text(div_text)
+            if adjustment_info:
+                return adjustment_info
+    except Exception:
+        pass
+    return _stable_adjustment()
+
+
+def _parse_with_selectolax(html):
+    """使用 selectolax (lexbor) 解析页面"""
+    tree = LexborHTMLParser(html)
+    pairs = []
+    for dl in tree.css('#youjia > dl'):
+        dt_node = dl.css_first('dt')
+        dd_node = dl.css_first('dd')
+        if dt_node and dd_node:
+            pairs.append((dt_node.text(), dd_node.text()))
+    
+    entries = _extract_prices_dom(pairs)
+    adjustment_info = _parse_adjustment_info(
+        div.text() for div in tree.css('#youjiaCont > div')
+    )
+    return entries, adjustment_info
+
+
+def _get_lxml_parser():
+    """获取当前线程复用的 lxml 解析器（lxml 解析器非线程安全）"""
+    parser = getattr(_lxml_local, 'parser', None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(encoding='utf-8', recover=True)
+        _lxml_local.parser = parser
+    return parser
+
+
+def _parse_with_lxml(raw):
+    """使用 lxml 解析页面字节，直接读取节点文本"""
+    try:
+        tree = lxml.html.fromstring(raw, parser=_get_lxml_parser())
+    except lxml.etree.ParserError:
+        # 空页面等无法解析的文档按未解析到数据处理
+        return {}, _stable_adjustment()
+    pairs = []
+    for dl in tree.xpath('//*[@id="youjia"]/dl'):
+        dt_element = dl.find('dt')
+        dd_element = dl.find('dd')
+        if dt_element is not None and dd_element is not None:
+            pairs.append((dt_element.text_content(), dd_element.text_content()))
+    
+    entries = _extract_prices_dom(pairs)
+    adjustment_info = _parse_adjustment_info(
+        div.text_content() for div in tree.xpath('//*[@id="youjiaCont"]/div')
+    )
+    return entries, adjustment_info
+
+
+def _parse_html_fast(html):
+    """快速路径：正则直接从对应区块片段提取油价与调整信息，无需构建DOM
+    
+    调整信息无法确定时为None；油价未匹配全部油品时需由DOM解析补全。
+    """
+    price_section, adjustment_section = _slice_sections(html)
+    entries = _extract_prices_fast(price_section) if price_section else {}
+    # 页面没有调价信息区块时与DOM解析结果一致，视为价格稳定
+    adjustment_info = (_extract_adjustment_fast(adjustment_section)
+                       if adjustment_section else _stable_adjustment())
+    return entries, adjustment_info
+
+
+def _parse_html_dom(raw):
+    """DOM解析省份页面HTML字节（在进程池中执行），优先使用 selectolax"""
+    if LexborHTMLParser is not None:
+        try:
+            return _parse_with_selectolax(raw.decode('utf-8', errors='replace'))
+        except Exception:
+            pass
+    return _parse_with_lxml(raw)
+
+
+# DOM解析进程池，仅在快速路径失败时按需创建，进程内复用
+_parse_pool = None
+
+
+def get_parse_pool():
+    """获取（必要时创建）进程内共享的DOM解析进程池"""
+    global _parse_pool
+    if _parse_pool is None:
+        # 使用 spawn 启动子进程，避免在已有DNS解析线程的进程中 fork
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    return _parse_pool
+
+
+async def close_parse_pool():
+    """关闭DOM解析进程池，在线程中等待退出以免阻塞事件循环"""
+    global _parse_pool
+    if _parse_pool is not None:
+        pool, _parse_pool = _parse_pool, None
+        await asyncio.get_running_loop().run_in_executor(None, pool.shutdown)
+
 
 class ChinaOilPriceAPI:
     def __init__(self, max_concurrent=20):
-        with open('provinces.json', 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            self.provinces = config['provinces']
+        self.provinces = PROVINCES
         self.max_concurrent = max_concurrent  # 控制并发量
         self.connector = None
+        self._cond_cache = self._load_http_cache()
 
     async def __aenter__(self):
-        # 创建TCP连接器，复用连接，限制总连接数
-        self.connector = aiohttp.TCPConnector(limit=self.max_concurrent, limit_per_host=5)
+        # 复用共享TCP连接器，避免每次运行重新建立连接池
+        self.connector = await get_shared_connector(self.max_concurrent)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.connector:
-            await self.connector.close()
+        # 共享连接器保持打开供后续抓取复用，由 close_shared_connector 统一关闭
+        self.connector = None
+        self._save_http_cache()
 
     async def fetch_all_prices(self):
         """异步并发抓取所有省份油价数据"""
@@ -34,173 +316,178 @@ class ChinaOilPriceAPI:
         print(f"📋 省份总数: {len(self.provinces)}, 并发数: {self.max_concurrent}")
         
         start_time = datetime.now()
+        # 本次抓取统一使用一个时间戳，避免逐条记录重复格式化
+        now_str = start_time.strftime('%Y-%m-%dT%H:%M:%S+08:00')
         all_data = {}
         success_count = 0
         
-        # 为每个省份创建异步任务
-        async with aiohttp.ClientSession(connector=self.connector) as session:
+        # 为每个省份创建异步任务，任务结果携带省份名称
+        # 关闭未使用的 Cookie 与环境代理探测，减少每个请求的额外开销
+        session = aiohttp.ClientSession(
+            connector=self.connector,
+            connector_owner=False,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            auto_decompress=True,
+            trust_env=False,
+            timeout=REQUEST_TIMEOUT
+        )
+        async with session:
             tasks = [
-                self.fetch_province_price(session, province_name, province_code)
+                asyncio.ensure_future(self._fetch_tagged(session, province_name, province_code, now_str))
                 for province_name, province_code in self.provinces.items()
             ]
             
-            # 等待所有任务完成并收集结果
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # 处理结果
-            for province_name, result in zip(self.provinces.keys(), results):
-                if isinstance(result, Exception):
-                    error_msg = f"异步任务异常: {str(result)}"
-                    all_data[province_name] = self._create_error_data(province_name, "", error_msg)
-                    print(f"💥 {province_name}: {error_msg}")
+            # 按完成顺序逐个处理结果，无需等待最慢的省份
+            for next_done in asyncio.as_completed(tasks):
+                province_name, result = await next_done
+                all_data[province_name] = result
+                if result['status'] == 'success':
+                    success_count += 1
+                    prices = result['prices']
+                    print(f"✅ {province_name}: 92#{prices['92']} 95#{prices['95']} 98#{prices['98']} 0#{prices['0']}")
                 else:
-                    all_data[province_name] = result
-                    if result['status'] == 'success':
-                        success_count += 1
-                        prices = result['prices']
-                        print(f"✅ {province_name}: 92#{prices['92']} 95#{prices['95']} 98#{prices['98']} 0#{prices['0']}")
-                    else:
-                        print(f"❌ {province_name}: {result['error']}")
+                    print(f"❌ {province_name}: {result['error']}")
+        
+        # 按配置顺序输出省份数据
+        all_data = {name: all_data[name] for name in self.provinces}
         
         duration = (datetime.now() - start_time).total_seconds()
         print(f"\n⏱️ 异步抓取总耗时: {duration:.2f}秒")
         
-        return self._create_final_output(all_data, success_count)
+        return self._create_final_output(all_data, success_count, now_str)
     
-    async def fetch_province_price(self, session, province_name, province_code):
+    async def _fetch_tagged(self, session, province_name, province_code, now_str):
+        """抓取单个省份油价数据，并附带省份名称返回"""
+        try:
+            result = await self.fetch_province_price(session, province_name, province_code, now_str)
+        except Exception as e:
+            result = self._create_error_data(province_name, province_code, f"异步任务异常: {str(e)}", now_str)
+        return province_name, result
+    
+    async def fetch_province_price(self, session, province_name, province_code, now_str=None):
         """异步抓取单个省份油价数据"""
+        if now_str is None:
+            now_str = datetime.now().strftime('%Y-%m-%dT%H:%M:%S+08:00')
         try:
             url = f'http://www.qiyoujiage.com/{province_code}.shtml'
             
-            # 发送异步GET请求
-            async with session.get(url, timeout=10) as response:
+            # 携带上次的 ETag/Last-Modified，页面未变化时服务器返回304
+            headers = REQUEST_HEADERS
+            cached = self._cond_cache.get(url)
+            if cached:
+                etag, last_modified, _ = cached
+                headers = dict(REQUEST_HEADERS)
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
+            # 发送异步GET请求，页面地址固定，无需跟随重定向
+            async with session.get(url, headers=headers, allow_redirects=False) as response:
+                if response.status == 304 and cached:
+                    # 页面未变化，直接复用上次解析结果
+                    return {**cached[2], "update_time": now_str}
                 if response.status != 200:
-                    return self._create_error_data(province_name, province_code, f"HTTP状态码: {response.status}")
-                
-                html = await response.text()
-                doc = BeautifulSoup(html, 'html.parser')
-                
-                # 解析油价数据
-                entries = {}
-                oil_elements = doc.select('#youjia > dl')
-                
-                for dl in oil_elements:
-                    dt_element = dl.select_one('dt')
-                    dd_element = dl.select_one('dd')
-                    
-                    if dt_element and dd_element:
-                        oil_type_text = dt_element.get_text().strip()
-                        price_value = dd_element.get_text().strip()
-                        
-                        if '92#' in oil_type_text:
-                            entries['92'] = self._parse_price(price_value)
-                        elif '95#' in oil_type_text:
-                            entries['95'] = self._parse_price(price_value)
-                        elif '98#' in oil_type_text:
-                            entries['98'] = self._parse_price(price_value)
-                        elif '0#' in oil_type_text or '柴油' in oil_type_text:
-                            entries['0'] = self._parse_price(price_value)
-                
-                # 解析调整信息
-                adjustment_info = self._parse_adjustment_info(doc)
-                
-                # 构建价格数据
-                prices = {
-                    '92': entries.get('92', 0),
-                    '95': entries.get('95', 0),
-                    '98': entries.get('98', 0),
-                    '0': entries.get('0', 0)
-                }
-                
-                # 检查是否获取到有效数据
-                valid_prices = any(price > 0 for price in prices.values())
-                if not valid_prices:
-                    return self._create_error_data(province_name, province_code, "未解析到油价数据")
-                
-                return {
-                    "status": "success",
-                    "name": province_name,
-                    "prices": prices,
-                    "next_adjustment": adjustment_info.get('next_adjustment'),
-                    "trend": adjustment_info.get('trend'),
-                    "update_time": datetime.now().strftime('%Y-%m-%dT%H:%M:%S+08:00')
-                }
+                    return self._create_error_data(province_name, province_code, f"HTTP状态码: {response.status}", now_str)
                 
+                # 站点固定为UTF-8编码，直接读取字节，跳过字符集探测
+                raw = await response.read()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+            
+            # 页面已更新，先丢弃旧缓存；仅当解析成功且带校验头时重新缓存
+            self._cond_cache.pop(url, None)
+            
+            # 快速路径耗时极短，直接在事件循环中执行
+            html = raw.decode('utf-8', errors='replace')
+            entries, adjustment_info = _parse_html_fast(html)
+            if len(entries) < len(_OIL_PRICE_KEYS) or adjustment_info is None:
+                # 快速路径未能完整解析时，在进程池中做DOM解析，避免阻塞事件循环
+                loop = asyncio.get_running_loop()
+                dom_entries, dom_adjustment = await loop.run_in_executor(get_parse_pool(), _parse_html_dom, raw)
+                if len(entries) < len(_OIL_PRICE_KEYS):
+                    # DOM结果优先，快速路径已匹配的油品用于补全
+                    entries = {**entries, **dom_entries}
+                if adjustment_info is None:
+                    adjustment_info = dom_adjustment
+            
+            prices = {
+                '92': entries.get('92', 0),
+                '95': entries.get('95', 0),
+                '98': entries.get('98', 0),
+                '0': entries.get('0', 0)
+            }
+            
+            # 检查是否获取到有效数据
+            valid_prices = any(price > 0 for price in prices.values())
+            if not valid_prices:
+                return self._create_error_data(province_name, province_code, "未解析到油价数据", now_str)
+            
+            result = {
+                "status": "success",
+                "name": province_name,
+                "prices": prices,
+                "next_adjustment": adjustment_info.get('next_adjustment'),
+                "trend": adjustment_info.get('trend'),
+                "update_time": now_str
+            }
+            if etag or last_modified:
+                self._cond_cache[url] = (etag, last_modified, result)
+            return result
+            
         except asyncio.TimeoutError:
-            return self._create_error_data(province_name, province_code, "请求超时")
+            return self._create_error_data(province_name, province_code, "请求超时", now_str)
         except aiohttp.ClientError as e:
-            return self._create_error_data(province_name, province_code, f"网络请求失败: {str(e)}")
+            return self._create_error_data(province_name, province_code, f"网络请求失败: {str(e)}", now_str)
         except Exception as e:
-            return self._create_error_data(province_name, province_code, f"解析异常: {str(e)}")
+            return self._create_error_data(province_name, province_code, f"解析异常: {str(e)}", now_str)
     
-    def _parse_price(self, price_text):
-        """解析价格文本为浮点数"""
+    def _load_http_cache(self):
+        """加载条件请求缓存，文件不存在、损坏或版本不符时返回空缓存"""
         try:
-            numeric_match = re.search(r'([\d.]+)', price_text)
-            return float(numeric_match.group(1)) if numeric_match else 0
-        except:
-            return 0
+            with open(HTTP_CACHE_FILE, 'rb') as f:
+                data = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        
+        if not isinstance(data, dict) or data.get('version') != HTTP_CACHE_VERSION:
+            return {}
+        entries = data.get('entries')
+        if not isinstance(entries, dict):
+            return {}
+        
+        # 丢弃结构不正确的条目，避免单个坏条目导致抓取失败
+        return {
+            url: entry for url, entry in entries.items()
+            if isinstance(entry, list) and len(entry) == 3
+            and all(value is None or isinstance(value, str) for value in entry[:2])
+            and isinstance(entry[2], dict) and entry[2].get('status') == 'success'
+        }
     
-    def _parse_adjustment_info(self, doc):
-        """解析油价调整信息"""
+    def _save_http_cache(self):
+        """保存条件请求缓存，供下次运行使用"""
         try:
-            adjustment_divs = doc.select('#youjiaCont > div')
-            for div in adjustment_divs:
-                div_text = div.get_text().strip()
-                
-                time_match = re.search(r'下次油价(\d+月\d+日\d+时调整)', div_text)
-                if time_match:
-                    next_adjustment = time_match.group(0)
-                    
-                    trend_match = re.search(r'目前预计(上调|下调)油价.*?\(([\d.]+)元/升', div_text)
-                    if trend_match:
-                        direction = "up" if trend_match.group(1) == "上调" else "down"
-                        amount = float(trend_match.group(2))
-                        trend_desc = "上调" if direction == "up" else "下调"
-                        
-                        return {
-                            "next_adjustment": next_adjustment,
-                            "trend": {
-                                "direction": direction,
-                                "amount": amount,
-                                "description": f"预计{trend_desc}{amount}元/升"
-                            }
-                        }
-            
-            return {
-                "next_adjustment": None,
-                "trend": {
-                    "direction": "stable", 
-                    "amount": 0,
-                    "description": "价格稳定"
-                }
-            }
-        except Exception:
-            return {
-                "next_adjustment": None,
-                "trend": {
-                    "direction": "stable", 
-                    "amount": 0,
-                    "description": "价格稳定"
-                }
-            }
+            with open(HTTP_CACHE_FILE, 'wb') as f:
+                f.write(orjson.dumps({"version": HTTP_CACHE_VERSION, "entries": self._cond_cache}))
+        except OSError as e:
+            print(f"⚠️ 条件请求缓存保存失败: {str(e)}")
     
-    def _create_error_data(self, province_name, province_code, error_message):
+    def _create_error_data(self, province_name, province_code, error_message, now_str):
         """创建错误数据"""
         return {
             "status": "error",
             "name": province_name,
             "error": error_message,
-            "update_time": datetime.now().strftime('%Y-%m-%dT%H:%M:%S+08:00')
+            "update_time": now_str
         }
     
-    def _create_final_output(self, all_data, success_count):
+    def _create_final_output(self, all_data, success_count, now_str):
         """创建最终输出"""
         total_provinces = len(self.provinces)
         
         return {
             "status": "success" if success_count > 0 else "error",
-            "last_updated": datetime.now().strftime('%Y-%m-%dT%H:%M:%S+08:00'),
+            "last_updated": now_str,
             "data_source": "www.qiyoujiage.com",
             "version": "3.0",
             "statistics": {
@@ -218,12 +505,16 @@ async def main():
     print(f"⏰ 开始时间: {start_time.strftime('%H:%M:%S')}")
     
     # 使用异步上下文管理器，控制并发数为15
-    async with ChinaOilPriceAPI(max_concurrent=5) as api:
-        result = await api.fetch_all_prices()
+    try:
+        async with ChinaOilPriceAPI(max_concurrent=5) as api:
+            result = await api.fetch_all_prices()
+    finally:
+        await close_shared_connector()
+        await close_parse_pool()
     
     # 保存数据
-    with open('oil_prices.json', 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    with open('oil_prices.json', 'wb') as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()